@@ -1,12 +1,24 @@
 import os
+import io
+import json
 import numpy as np
-from PIL import Image, ImageDraw, ImageFont
-import random
+from PIL import Image, ImageDraw, ImageFont, UnidentifiedImageError
 import math
 import tkinter as tk
 from tkinter import ttk
 from PIL import ImageTk
 import time
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+
+# numba is optional, it is only used to speed up copying the tiles
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Random generator used to pick the photo for each cell
+rng = np.random.default_rng()
 
 def read_settings(settings_file="settings.txt"):
     """
@@ -26,7 +38,8 @@ def read_settings(settings_file="settings.txt"):
         "height": 900,
         "text": "Years Anniversary",
         "refresh_interval": 5,
-        "fullscreen": True  # Added fullscreen setting with default as True
+        "fullscreen": True,  # Added fullscreen setting with default as True
+        "tile_cache": "tiles.npy"  # Resized photos kept between runs, empty to disable
     }
     
     # Try to read settings from file
@@ -68,7 +81,7 @@ def read_settings(settings_file="settings.txt"):
     return settings
 
 class PhotoCollageApp:
-    def __init__(self, root, number, photos_directory, width=1200, height=800, text=None, refresh_interval=5, fullscreen=False):
+    def __init__(self, root, number, photos_directory, width=1200, height=800, text=None, refresh_interval=5, fullscreen=False, tile_cache=None):
         """
         Initialize the photo collage application.
         
@@ -81,6 +94,7 @@ class PhotoCollageApp:
         text (str): Optional text to add below the number
         refresh_interval (int): Time in seconds between refreshes
         fullscreen (bool): Whether to display in fullscreen mode
+        tile_cache (str): Optional .npy file to keep the resized photos in between runs
         """
         self.root = root
         self.root.title(f"Photo Collage {number} Years Anniversary")
@@ -92,6 +106,17 @@ class PhotoCollageApp:
         self.text = text
         self.refresh_interval = refresh_interval * 1000  # Convert to milliseconds
         self.fullscreen = fullscreen
+        self.tile_cache = tile_cache
+        
+        # The layout of the number only changes with the cell size, which
+        # depends on the number of photos, so it is cached between refreshes
+        self.layout_key = None
+        self.layout = None
+        
+        # The resized photos only change with the photo list or the cell
+        # size, so they are kept between refreshes as well
+        self.tile_pool_key = None
+        self.tile_pool = None
         
         # Set fullscreen mode
         if self.fullscreen:
@@ -137,15 +162,34 @@ class PhotoCollageApp:
         self.status_var.set("Generating collage...")
         self.root.update()
         
-        # Create the collage
-        collage = create_number_photo_collage(
-            self.number, 
-            self.photos_directory, 
-            self.width, 
-            self.height, 
-            self.text,
-            return_image=True
-        )
+        photo_files = list_photo_files(self.photos_directory)
+        cell_size = get_cell_size(self.width, self.height, len(photo_files))
+        
+        # Recompute the layout only when its inputs have changed
+        layout_key = (self.number, self.width, self.height, cell_size)
+        if layout_key != self.layout_key:
+            self.layout = compute_layout(self.number, self.width, self.height, cell_size)
+            self.layout_key = layout_key
+        
+        # Rebuild the tile pool only when the photos or cell size have changed
+        tile_pool_key = (tuple(photo_files), cell_size)
+        if tile_pool_key != self.tile_pool_key:
+            # Release the old pool first, it may still map the cache file
+            # that is about to be replaced
+            self.tile_pool = None
+            self.tile_pool_key = None
+            self.tile_pool = build_tile_pool(photo_files, cell_size, self.tile_cache)
+            self.tile_pool_key = tile_pool_key
+        
+        # Create the collage with a new random selection of photos
+        collage = render_collage(self.layout, cell_size, self.tile_pool, self.width, self.height, self.text)
+        
+        # Scale the collage down to the space available on screen, so Tk
+        # does not have to convert pixels that cannot be displayed
+        label_width = self.image_label.winfo_width()
+        label_height = self.image_label.winfo_height()
+        if label_width > 1 and label_height > 1:
+            collage.thumbnail((label_width, label_height), Image.BILINEAR)
         
         # Convert to PhotoImage and display
         self.photo = ImageTk.PhotoImage(collage)
@@ -154,6 +198,11 @@ class PhotoCollageApp:
         self.status_var.set(f"Updated: {time.strftime('%H:%M:%S')}")
 
 
+# Define the mapping between number of images and cell size multiplier
+IMAGE_COUNTS = np.array([0, 2, 8, 12, 28, 52, 88, 200])
+CELL_SIZE_MULTIPLIERS = np.array([0.04, 0.04, 0.02, 0.02, 0.02, 0.02, 0.02, 0.01])
+
+
 def get_cell_size_multiplier(num_images):
     """
     Get the appropriate cell size multiplier based on the number of images.
@@ -164,93 +213,100 @@ def get_cell_size_multiplier(num_images):
     Returns:
     float: Cell size multiplier
     """
-    # Define the mapping between number of images and cell size multiplier
-    # Format: [num_images, multiplier]
-    image_to_cell_ratio = [
-        [0, 0.04],
-        [2, 0.04],
-        [8, 0.02],
-        [12, 0.02],
-        [28, 0.02],
-        [52, 0.02],
-        [88, 0.02],
-        [200, 0.01]
-    ]
-    
-    # If fewer than the minimum images
-    if num_images <= image_to_cell_ratio[0][0]:
-        return image_to_cell_ratio[0][1]
-    
-    # If more than the maximum images
-    if num_images >= image_to_cell_ratio[-1][0]:
-        return image_to_cell_ratio[-1][1]
-    
-    # Find the appropriate interval and interpolate
-    for i in range(len(image_to_cell_ratio) - 1):
-        lower_bound = image_to_cell_ratio[i]
-        upper_bound = image_to_cell_ratio[i + 1]
-        
-        if lower_bound[0] <= num_images < upper_bound[0]:
-            # Linear interpolation
-            ratio = (num_images - lower_bound[0]) / (upper_bound[0] - lower_bound[0])
-            multiplier = lower_bound[1] + ratio * (upper_bound[1] - lower_bound[1])
-            return multiplier
-    
-    # Fallback to a default value
-    return 0.05
+    # Interpolate linearly between the mapped values, clamping to the
+    # first and last multiplier outside of the mapped range
+    return float(np.interp(num_images, IMAGE_COUNTS, CELL_SIZE_MULTIPLIERS))
 
 
-def create_number_photo_collage(number, photos_directory, width=1200, height=800, text=None, return_image=False):
+@lru_cache(maxsize=None)
+def load_font(size):
     """
-    Create a number-shaped photo collage.
+    Load the collage font at the given size, falling back to the default font.
+    
+    Fonts are cached so that refreshes do not parse the font file again.
     
     Parameters:
-    number (str): The number or text to create as a collage
-    photos_directory (str): Directory containing photos to use
-    width (int): Width of the output image
-    height (int): Height of the output image
-    text (str): Optional text to add below the number
-    return_image (bool): If True, return the PIL Image object instead of displaying it
+    size (int): Font size in pixels
     
     Returns:
-    PIL.Image.Image: The collage image if return_image is True
+    PIL.ImageFont: The font
     """
-    # Create a blank white image
-    collage = Image.new('RGB', (width, height), (255, 255, 255))
-    draw = ImageDraw.Draw(collage)
-    
-    # Create mask for the number shape
-    mask = Image.new('L', (width, height), 0)
-    mask_draw = ImageDraw.Draw(mask)
-    
-    # Choose a font and size for the number
     try:
-        font = ImageFont.truetype("arial.ttf", int(height * 1.0))
+        return ImageFont.truetype("arial.ttf", size)
     except IOError:
-        font = ImageFont.load_default()
+        return ImageFont.load_default()
+
+
+def get_text_size(font, text):
+    """
+    Measure the width and height of a text rendered with the given font.
     
-    # Draw the number as a mask
+    Parameters:
+    font (PIL.ImageFont): Font returned by load_font
+    text (str): The text to measure
+    
+    Returns:
+    tuple: (width, height) of the text
+    """
     if hasattr(font, "getsize"):
-        text_width, text_height = font.getsize(number)
-    else:
-        # For newer Pillow versions
-        bbox = font.getbbox(number)
-        text_width = bbox[2] - bbox[0]
-        text_height = bbox[3] - bbox[1]
+        return font.getsize(text)
     
-    position = ((width - text_width) // 2, (height - text_height) // 2 - int(height * 0.225))
-    mask_draw.text(position, number, fill=255, font=font)
+    # For newer Pillow versions
+    left, top, right, bottom = get_text_bbox(font, text)
+    return right - left, bottom - top
+
+
+@lru_cache(maxsize=None)
+def get_text_bbox(font, text):
+    """
+    Get the bounding box of a text drawn at the origin with the given font.
+    
+    Parameters:
+    font (PIL.ImageFont): Font returned by load_font
+    text (str): The text to measure
+    
+    Returns:
+    tuple: (left, top, right, bottom) of the drawn text
+    """
+    if hasattr(font, "getbbox"):
+        return font.getbbox(text)
+    
+    # For older Pillow versions
+    text_width, text_height = font.getsize(text)
+    return 0, 0, text_width, text_height
+
+
+def list_photo_files(photos_directory):
+    """
+    List the photos available for the collage.
+    
+    Parameters:
+    photos_directory (str): Directory containing photos to use
     
-    # Get list of all photos in the directory
+    Returns:
+    list: Paths of all PNG and JPEG files in the directory
+    """
     photo_files = [os.path.join(photos_directory, f) for f in os.listdir(photos_directory) 
                   if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
     
     if not photo_files:
         raise ValueError("No photos found in the specified directory")
     
-    # Count the number of images
-    num_images = len(photo_files)
+    return photo_files
+
+
+def get_cell_size(width, height, num_images):
+    """
+    Calculate the grid cell size for the given collage size and photo count.
+    
+    Parameters:
+    width (int): Width of the output image
+    height (int): Height of the output image
+    num_images (int): Number of photos available
     
+    Returns:
+    int: Width and height of a grid cell in pixels
+    """
     # Get the cell size multiplier based on the number of images
     cell_size_multiplier = get_cell_size_multiplier(num_images)
     
@@ -262,63 +318,169 @@ def create_number_photo_collage(number, photos_directory, width=1200, height=800
     print(f"Cell size multiplier: {cell_size_multiplier}")
     print(f"Cell size: {cell_size}")
     
+    return cell_size
+
+
+def compute_layout(number, width, height, cell_size):
+    """
+    Find the grid cells that make up the shape of the number.
+    
+    The layout only depends on its arguments, so it can be baked once and
+    reused for every refresh as long as they do not change. Rendering it
+    is then only a matter of copying tiles to the listed positions.
+    
+    Parameters:
+    number (str): The number or text to create as a collage
+    width (int): Width of the output image
+    height (int): Height of the output image
+    cell_size (int): Width and height of a grid cell
+    
+    Returns:
+    numpy.ndarray: int32 (y, x) pixel position of every occupied cell, in row-major order
+    """
+    # Choose a font and size for the number
+    font = load_font(int(height * 1.0))
+    
+    text_width, text_height = get_text_size(font, number)
+    position = ((width - text_width) // 2, (height - text_height) // 2 - int(height * 0.225))
+    
     cols = width // cell_size
     rows = height // cell_size
     
-    # For each cell in the grid
-    for row in range(rows):
-        for col in range(cols):
-            x = col * cell_size
-            y = row * cell_size
-            
-            # Check if this cell is within the number shape
-            points_in_mask = 0
-            samples = 5
-            for sx in range(samples):
-                for sy in range(samples):
-                    sample_x = x + (cell_size * sx) // samples
-                    sample_y = y + (cell_size * sy) // samples
-                    if sample_x < width and sample_y < height:
-                        if mask.getpixel((sample_x, sample_y)) > 0:
-                            points_in_mask += 1
-            
-            # If most points are in the mask, place a photo here
-            if points_in_mask > (samples * samples) // 2:
-                # Choose a random photo
-                photo_path = random.choice(photo_files)
-                try:
-                    photo = Image.open(photo_path)
-                    
-                    # Resize and crop to fit the cell
-                    photo = resize_and_crop_improved(photo, (cell_size, cell_size))
-                    
-                    # Paste the photo into the collage
-                    collage.paste(photo, (x, y))
-                except Exception as e:
-                    print(f"Error processing {photo_path}: {e}")
+    # Only the grid cells under the number can be covered, so the mask is
+    # limited to those cells instead of spanning the whole image
+    left, top, right, bottom = get_text_bbox(font, number)
+    first_col = max((position[0] + left) // cell_size, 0)
+    first_row = max((position[1] + top) // cell_size, 0)
+    last_col = min(math.ceil((position[0] + right) / cell_size), cols)
+    last_row = min(math.ceil((position[1] + bottom) / cell_size), rows)
+    if first_col >= last_col or first_row >= last_row:
+        return np.empty((0, 2), dtype=np.int32)
+    
+    # Draw the number as a mask
+    mask_cols = last_col - first_col
+    mask_rows = last_row - first_row
+    mask = Image.new('L', (mask_cols * cell_size, mask_rows * cell_size), 0)
+    mask_position = (position[0] - first_col * cell_size, position[1] - first_row * cell_size)
+    ImageDraw.Draw(mask).text(mask_position, number, fill=255, font=font)
+    
+    # Count how many pixels of every cell fall within the number shape
+    mask_arr = np.asarray(mask, dtype=np.uint8) > 0
+    pixels_in_mask = mask_arr.reshape(mask_rows, cell_size, mask_cols, cell_size).sum(axis=(1, 3))
+    
+    # Cells mostly covered by the mask get a photo. np.argwhere returns
+    # them row by row, so rendering fills one band of canvas rows at a time
+    # while those rows are still in cache.
+    cells = np.argwhere(pixels_in_mask * 2 > cell_size * cell_size) + (first_row, first_col)
+    return (cells * cell_size).astype(np.int32)
+
+
+def blit_tiles(canvas, layout, cell_size, tile_pool, tile_indices):
+    """
+    Copy tiles into the canvas at the positions of a layout.
+    
+    Parameters:
+    canvas (numpy.ndarray): uint8 (height, width, 3) array to draw on
+    layout (numpy.ndarray): Cell positions returned by compute_layout
+    cell_size (int): Width and height of a grid cell
+    tile_pool (numpy.ndarray): Tiles returned by build_tile_pool
+    tile_indices (numpy.ndarray): Index of the tile to use for each cell
+    """
+    for (y, x), tile_index in zip(layout, tile_indices):
+        canvas[y:y + cell_size, x:x + cell_size] = tile_pool[tile_index]
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def blit_tiles(canvas, layout, cell_size, tile_pool, tile_indices):
+        """Compiled version of blit_tiles, copying the cells on all cores."""
+        # Copy each tile as contiguous runs of bytes, one per pixel row,
+        # which numba turns into much faster loops than 3D slice copies
+        row_bytes = cell_size * canvas.shape[2]
+        canvas_rows = canvas.reshape(canvas.shape[0], -1)
+        tile_rows = tile_pool.reshape(tile_pool.shape[0], cell_size, row_bytes)
+        
+        # Cells never overlap, so every iteration writes its own region
+        for i in prange(len(tile_indices)):
+            y = layout[i, 0]
+            x = layout[i, 1] * canvas.shape[2]
+            tile = tile_rows[tile_indices[i]]
+            for row in range(cell_size):
+                canvas_rows[y + row, x:x + row_bytes] = tile[row]
+
+
+def render_collage(layout, cell_size, tile_pool, width, height, text=None):
+    """
+    Fill the cells of a layout with random tiles and add the text.
+    
+    Parameters:
+    layout (numpy.ndarray): Cell positions returned by compute_layout
+    cell_size (int): Width and height of a grid cell
+    tile_pool (numpy.ndarray): Tiles returned by build_tile_pool
+    width (int): Width of the output image
+    height (int): Height of the output image
+    text (str): Optional text to add below the number
+    
+    Returns:
+    PIL.Image.Image: The collage image
+    """
+    # Start from a blank white canvas
+    canvas = np.full((height, width, 3), 255, dtype=np.uint8)
+    
+    # Place a random photo in every occupied cell
+    tile_indices = rng.integers(0, len(tile_pool), size=len(layout))
+    blit_tiles(canvas, layout, cell_size, np.asarray(tile_pool), tile_indices)
     
     # Add text if provided
     if text:
-        try:
-            text_font = ImageFont.truetype("arial.ttf", int(height * 0.05))
-        except IOError:
-            text_font = ImageFont.load_default()
+        text_font = load_font(int(height * 0.05))
+        text_width, text_height = get_text_size(text_font, text)
         
-        # Using the same method for text size calculation    
-        if hasattr(text_font, "getsize"):
-            text_width, text_height = text_font.getsize(text)
-        else:
-            # For newer Pillow versions
-            bbox = text_font.getbbox(text)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-            
-        text_position = ((width - text_width) // 2, height - text_height - 75)
-        draw.text(text_position, text, fill=(0, 0, 0), font=text_font)
-    
-    # Save the final collage  <<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<<
-    output_file="6_years_anniversary_collage_16k.png"
-    collage.save(output_file)
+        text_x = (width - text_width) // 2
+        text_y = height - text_height - 75
+        
+        # Only draw on the part of the canvas covered by the text, so the
+        # canvas is not copied into a separate image for drawing
+        left, top, right, bottom = get_text_bbox(text_font, text)
+        left, top = max(text_x + left, 0), max(text_y + top, 0)
+        right, bottom = min(text_x + right, width), min(text_y + bottom, height)
+        if left < right and top < bottom:
+            patch = Image.fromarray(canvas[top:bottom, left:right])
+            ImageDraw.Draw(patch).text((text_x - left, text_y - top), text, fill=(0, 0, 0), font=text_font)
+            canvas[top:bottom, left:right] = np.asarray(patch)
+    
+    return Image.fromarray(canvas)
+
+
+def create_number_photo_collage(number, photos_directory, width=1200, height=800, text=None, return_image=False, save_path=None):
+    """
+    Create a number-shaped photo collage.
+    
+    Parameters:
+    number (str): The number or text to create as a collage
+    photos_directory (str): Directory containing photos to use
+    width (int): Width of the output image
+    height (int): Height of the output image
+    text (str): Optional text to add below the number
+    return_image (bool): If True, return the PIL Image object instead of displaying it
+    save_path (str): Optional file to save the collage to
+    
+    Returns:
+    PIL.Image.Image: The collage image if return_image is True
+    """
+    photo_files = list_photo_files(photos_directory)
+    cell_size = get_cell_size(width, height, len(photo_files))
+    
+    layout = compute_layout(number, width, height, cell_size)
+    
+    # Resize every photo to the cell size once
+    tile_pool = build_tile_pool(photo_files, cell_size)
+    
+    collage = render_collage(layout, cell_size, tile_pool, width, height, text)
+    
+    # Save the final collage if requested
+    if save_path:
+        collage.save(save_path)
 
     if return_image:
         return collage
@@ -327,57 +489,237 @@ def create_number_photo_collage(number, photos_directory, width=1200, height=800
         return None
 
 
+def load_tile(photo_path, cell_size):
+    """
+    Load a photo resized and cropped to a square cell.
+    
+    Parameters:
+    photo_path (str): Path to the photo
+    cell_size (int): Width and height of the tile
+    
+    Returns:
+    PIL.Image: The tile
+    """
+    # Read the whole file in one request instead of letting the decoder
+    # pull it from disk in small chunks
+    with open(photo_path, 'rb') as f:
+        data = io.BytesIO(f.read())
+    
+    try:
+        photo = Image.open(data)
+    except UnidentifiedImageError:
+        # Name the file rather than the in-memory buffer
+        raise UnidentifiedImageError(f"cannot identify image file {photo_path!r}") from None
+    
+    with photo:
+        return resize_and_crop_improved(photo, (cell_size, cell_size))
+
+
+def build_tile_pool(photo_files, cell_size, cache_file=None):
+    """
+    Build an array holding every photo resized and cropped to a cell.
+    
+    Parameters:
+    photo_files (list): Paths of the photos to use
+    cell_size (int): Width and height of each tile
+    cache_file (str): Optional .npy file to keep the tiles in between runs
+    
+    Returns:
+    numpy.ndarray: uint8 array of shape (num_tiles, cell_size, cell_size, 3)
+    """
+    signature = None
+    if cache_file:
+        # The cached tiles are only valid for the same photos and cell size.
+        # If a photo cannot be read, skip the cache and let the loading
+        # below report it.
+        try:
+            photos = []
+            for photo_path in photo_files:
+                stat = os.stat(photo_path)
+                photos.append([photo_path, stat.st_mtime_ns, stat.st_size])
+            signature = {"cell_size": cell_size, "photos": photos}
+        except OSError as e:
+            print(f"Not using tile cache {cache_file}: {e}")
+    
+    if signature:
+        tile_pool = load_cached_tile_pool(cache_file, signature)
+        if tile_pool is not None:
+            return tile_pool
+    
+    def load(photo_path):
+        try:
+            return np.asarray(load_tile(photo_path, cell_size))
+        except Exception as e:
+            print(f"Error processing {photo_path}: {e}")
+            return None
+    
+    # Pillow releases the GIL while decoding and resizing, so the photos
+    # can be processed in parallel. The default pool has more threads than
+    # cores, so reads waiting on the disk overlap with decoding in the
+    # other threads.
+    with ThreadPoolExecutor() as executor:
+        tiles = [tile for tile in executor.map(load, photo_files) if tile is not None]
+    
+    if not tiles:
+        raise ValueError("None of the photos could be loaded")
+    
+    if signature:
+        tile_pool = save_cached_tile_pool(cache_file, signature, tiles)
+        if tile_pool is not None:
+            return tile_pool
+    
+    # Keep all tiles in one contiguous block starting on a cache line, so
+    # copying a tile never touches more cache lines than needed
+    tile_pool = empty_aligned((len(tiles),) + tiles[0].shape, np.uint8)
+    for i, tile in enumerate(tiles):
+        tile_pool[i] = tile
+    
+    return tile_pool
+
+
+def empty_aligned(shape, dtype, alignment=64):
+    """
+    Allocate an uninitialized C-contiguous array with an aligned start address.
+    
+    Parameters:
+    shape (tuple): Shape of the array
+    dtype (numpy.dtype): Data type of the array
+    alignment (int): Required alignment of the data in bytes
+    
+    Returns:
+    numpy.ndarray: The uninitialized array
+    """
+    dtype = np.dtype(dtype)
+    nbytes = math.prod(shape) * dtype.itemsize
+    
+    # Over-allocate and start the array at the first aligned byte
+    buffer = np.empty(nbytes + alignment, dtype=np.uint8)
+    offset = -buffer.ctypes.data % alignment
+    return buffer[offset:offset + nbytes].view(dtype).reshape(shape)
+
+
+def load_cached_tile_pool(cache_file, signature):
+    """
+    Memory-map a tile pool saved by save_cached_tile_pool.
+    
+    Parameters:
+    cache_file (str): Path of the .npy file
+    signature (dict): Cell size and photo list the tiles must match
+    
+    Returns:
+    numpy.ndarray: The read-only tile pool, or None if it is missing or stale
+    """
+    signature_file = os.path.splitext(cache_file)[0] + ".json"
+    try:
+        with open(signature_file, 'r') as f:
+            if json.load(f) != signature:
+                return None
+        tile_pool = np.load(cache_file, mmap_mode='r')
+        
+        # Do not trust a file whose tiles do not have the expected shape
+        cell_size = signature["cell_size"]
+        if tile_pool.ndim != 4 or tile_pool.shape[1:] != (cell_size, cell_size, 3):
+            return None
+        return tile_pool
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Error reading tile cache {cache_file}: {e}")
+        return None
+
+
+def save_cached_tile_pool(cache_file, signature, tiles):
+    """
+    Save tiles to a .npy file next to a JSON file describing their source.
+    
+    Parameters:
+    cache_file (str): Path of the .npy file
+    signature (dict): Cell size and photo list the tiles were built from
+    tiles (list): Tiles of identical shape to save
+    
+    Returns:
+    numpy.ndarray: The saved tiles memory-mapped read-only, or None on error
+    """
+    signature_file = os.path.splitext(cache_file)[0] + ".json"
+    temp_file = cache_file + ".tmp"
+    try:
+        # Fill a new file and move it into place afterwards, so an
+        # interrupted write never leaves a partial cache file. The
+        # .npy header is padded to 64 bytes, so the mapped tiles start on a
+        # cache line like the ones from empty_aligned.
+        tile_pool = np.lib.format.open_memmap(temp_file, mode='w+', dtype=np.uint8,
+                                              shape=(len(tiles),) + tiles[0].shape)
+        for i, tile in enumerate(tiles):
+            tile_pool[i] = tile
+        tile_pool.flush()
+        del tile_pool
+        
+        # Remove the old signature first, so an interruption cannot leave it
+        # next to the new tiles
+        if os.path.exists(signature_file):
+            os.remove(signature_file)
+        os.replace(temp_file, cache_file)
+        
+        with open(signature_file, 'w') as f:
+            json.dump(signature, f)
+        
+        print(f"Saved tile cache: {cache_file}")
+        return np.load(cache_file, mmap_mode='r')
+    except Exception as e:
+        print(f"Error saving tile cache {cache_file}: {e}")
+        try:
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        except OSError:
+            pass
+        return None
+
+
 def resize_and_crop_improved(image, size):
     """
     Improved version that better handles different aspect ratios.
     Resize and crop an image to fit the specified size without leaving empty spaces.
     
     Parameters:
-    image (PIL.Image): The input image
+    image (PIL.Image): The input image, preferably not loaded yet
     size (tuple): The target size (width, height)
     
     Returns:
     PIL.Image: The resized and cropped image
     """
+    target_width, target_height = size
+    
+    # Let libjpeg decode large photos at a reduced scale (1/2, 1/4 or 1/8)
+    # that is still at least twice the target size. This must happen
+    # before any pixel access, so the image has to be freshly opened.
+    if image.format == 'JPEG':
+        image.draft('RGB', (target_width * 2, target_height * 2))
+    
     # Convert to RGB if image has transparency or is in a different mode
     if image.mode != 'RGB':
         image = image.convert('RGB')
     
     # Calculate aspect ratios
-    target_width, target_height = size
     target_ratio = target_width / target_height
     img_width, img_height = image.size
     img_ratio = img_width / img_height
     
-    # Determine which dimension to fit
+    # Determine which dimension to fit and the part of the image to keep
     if img_ratio > target_ratio:
         # Image is wider than the target ratio - fit height and crop width
-        scale_factor = target_height / img_height
-        new_width = int(img_width * scale_factor)
-        new_height = target_height
-        resized = image.resize((new_width, new_height), Image.LANCZOS)
-        
-        # Crop to fit width
-        left = (resized.width - target_width) // 2
-        right = left + target_width
-        top = 0
-        bottom = target_height
-        cropped = resized.crop((left, top, right, bottom))
+        crop_width = img_height * target_ratio
+        left = (img_width - crop_width) / 2
+        box = (left, 0, left + crop_width, img_height)
     else:
         # Image is taller than the target ratio - fit width and crop height
-        scale_factor = target_width / img_width
-        new_width = target_width
-        new_height = int(img_height * scale_factor)
-        resized = image.resize((new_width, new_height), Image.LANCZOS)
-        
-        # Crop to fit height
-        left = 0
-        right = target_width
-        top = (resized.height - target_height) // 2
-        bottom = top + target_height
-        cropped = resized.crop((left, top, right, bottom))
-    
-    return cropped
+        crop_height = img_width / target_ratio
+        top = (img_height - crop_height) / 2
+        box = (0, top, img_width, top + crop_height)
+    
+    # Resize only the kept part in one step. The reducing gap first shrinks
+    # large images by an integer factor with a fast box filter, so the
+    # LANCZOS filter runs on far fewer pixels.
+    return image.resize(size, Image.LANCZOS, box=box, reducing_gap=3.0)
 
 
 # Example usage
@@ -411,7 +753,8 @@ if __name__ == "__main__":
         height=settings["height"]-40,
         text=settings["text"],
         refresh_interval=settings["refresh_interval"],
-        fullscreen=settings.get("fullscreen", True)  # Default to True if not specified
+        fullscreen=settings.get("fullscreen", True),  # Default to True if not specified
+        tile_cache=settings["tile_cache"]
     )
     
     # Start the application